@@ -5,8 +5,17 @@ from .vectors import Vector2, Vector3
 from .fields import ElectricField, MagneticField, UniformElectricField, UniformMagneticField
 from .electron import Electron
 from .lorentz import lorentz_force
-from .integrators import State, AccelerationFn, rk4_step
-from .diagnostics import kinetic_energy, verify_magnetic_energy_conservation, EnergyConservationCheck
+from .integrators import (
+	State,
+	BatchState,
+	AccelerationFn,
+	BatchAccelerationFn,
+	boris_step,
+	rk4_step,
+	rk4_step_batch,
+	rk45_step,
+)
+from .diagnostics import kinetic_energy, kinetic_energy_batch, verify_magnetic_energy_conservation, EnergyConservationCheck
 
 __all__ = [
     "ELECTRON_CHARGE_COULOMBS",
@@ -18,9 +27,15 @@ __all__ = [
 	"Electron",
 	"lorentz_force",
 	"State",
+	"BatchState",
 	"AccelerationFn",
+	"BatchAccelerationFn",
+	"boris_step",
 	"rk4_step",
+	"rk4_step_batch",
+	"rk45_step",
 	"kinetic_energy",
+	"kinetic_energy_batch",
 	"verify_magnetic_energy_conservation",
 	"EnergyConservationCheck",
 ]
@@ -0,0 +1,68 @@
+"""Optional Numba-compiled RK4 kernel for the uniform-Bz fast path.
+
+Numba is an optional dependency: when it is missing this module still imports
+and exposes `rk4_step_bz = None` so callers can feature-test with one check.
+The kernel inlines the closed-form uniform-field acceleration
+(`ax = ex_qm + wz*vy; ay = ey_qm - wz*vx`) so a full RK4 step is pure scalar
+arithmetic with no Python object boxing. `cache=True` persists the compiled
+artifact on disk so interactive sessions only pay the JIT cost once.
+"""
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy batch path remains available.
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def rk4_step_bz(
+        px: float,
+        py: float,
+        vx: float,
+        vy: float,
+        dt_s: float,
+        ex_qm: float,
+        ey_qm: float,
+        wz: float,
+    ) -> tuple[float, float, float, float]:
+        """Advance one particle by one RK4 step under uniform E and Bz.
+
+        Same tableau as `integrators.rk4_step`; acceleration is time- and
+        position-independent here, so only velocities feed the stages.
+        """
+        half_dt = 0.5 * dt_s
+
+        # Stage 1
+        a1x = ex_qm + wz * vy
+        a1y = ey_qm - wz * vx
+
+        # Stage 2
+        v2x = vx + a1x * half_dt
+        v2y = vy + a1y * half_dt
+        a2x = ex_qm + wz * v2y
+        a2y = ey_qm - wz * v2x
+
+        # Stage 3
+        v3x = vx + a2x * half_dt
+        v3y = vy + a2y * half_dt
+        a3x = ex_qm + wz * v3y
+        a3y = ey_qm - wz * v3x
+
+        # Stage 4
+        v4x = vx + a3x * dt_s
+        v4y = vy + a3y * dt_s
+        a4x = ex_qm + wz * v4y
+        a4y = ey_qm - wz * v4x
+
+        sixth_dt = dt_s / 6.0
+        new_px = px + sixth_dt * (vx + 2.0 * v2x + 2.0 * v3x + v4x)
+        new_py = py + sixth_dt * (vy + 2.0 * v2y + 2.0 * v3y + v4y)
+        new_vx = vx + sixth_dt * (a1x + 2.0 * a2x + 2.0 * a3x + a4x)
+        new_vy = vy + sixth_dt * (a1y + 2.0 * a2y + 2.0 * a3y + a4y)
+        return new_px, new_py, new_vx, new_vy
+
+else:
+    rk4_step_bz = None
@@ -3,11 +3,15 @@
 Design notes:
 - Magnetic fields do no work: with E=0, kinetic energy should remain constant.
 - Functions are stateless and reusable across simulation setups.
+- Whole-trajectory checks run on NumPy arrays so long recordings are one
+  vectorized pass instead of a per-sample Python loop.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from .electron import Electron
 from .integrators import State
@@ -23,6 +27,17 @@ def kinetic_energy(mass_kg: float, velocity: Vector2) -> float:
     return 0.5 * mass_kg * (vx * vx + vy * vy)
 
 
+def kinetic_energy_batch(mass_kg: float, velocities: np.ndarray) -> np.ndarray:
+    """Return kinetic energies (Joules) for an array of velocities.
+
+    Accepts any shape ending in a 2-component velocity axis, e.g. `(M, 2)`
+    for one trajectory or `(M, N, 2)` for a whole batch, and returns the
+    matching shape with the last axis reduced.
+    """
+    velocities = np.asarray(velocities, dtype=np.float64)
+    return 0.5 * mass_kg * np.square(velocities).sum(axis=-1)
+
+
 @dataclass
 class EnergyConservationCheck:
     """Summary of per-electron energy stability when E=0 (magnetic-only)."""
@@ -32,9 +47,20 @@ class EnergyConservationCheck:
     max_absolute_deviation: List[float]
 
 
+def _trajectory_velocities(samples: Union[Sequence[State], np.ndarray]) -> np.ndarray:
+    """Collect trajectory velocities into an `(M, 2)` array.
+
+    Accepts either a sequence of `State` samples or an already-packed array
+    of velocity components, so callers holding raw buffers skip conversion.
+    """
+    if isinstance(samples, np.ndarray):
+        return samples.reshape(-1, 2)
+    return np.array([(s.velocity.x, s.velocity.y) for s in samples], dtype=np.float64).reshape(-1, 2)
+
+
 def verify_magnetic_energy_conservation(
     electrons: Sequence[Electron],
-    trajectories: Sequence[Sequence[State]],
+    trajectories: Sequence[Union[Sequence[State], np.ndarray]],
     rel_tol: float = 1e-3,
     abs_tol: float = 1e-12,
 ) -> EnergyConservationCheck:
@@ -42,7 +68,9 @@ def verify_magnetic_energy_conservation(
 
     Assumptions:
     - Only magnetic field is present (E=0). Magnetic fields do no work.
-    - Trajectories align index-wise with the provided electrons.
+    - Trajectories align index-wise with the provided electrons. Each
+      trajectory may be a sequence of `State` samples or an `(M, 2)` array
+      of velocity components.
 
     Returns an `EnergyConservationCheck` with aggregate deviation metrics and
     a pass/fail flag using both absolute and relative tolerances.
@@ -51,24 +79,19 @@ def verify_magnetic_energy_conservation(
     max_abs: List[float] = []
 
     for e, samples in zip(electrons, trajectories):
-        if not samples:
+        velocities = _trajectory_velocities(samples)
+        if velocities.shape[0] == 0:
             # No samples: trivially passes with zero deviation.
             max_rel.append(0.0)
             max_abs.append(0.0)
             continue
 
-        e0 = kinetic_energy(e.mass_kg, samples[0].velocity)
-        rel_deviation = 0.0
-        abs_deviation = 0.0
+        ke = kinetic_energy_batch(e.mass_kg, velocities)
+        e0 = float(ke[0])
         denom = e0 if e0 != 0.0 else 1.0  # avoid divide-by-zero in relative error
 
-        for s in samples:
-            ek = kinetic_energy(e.mass_kg, s.velocity)
-            d = abs(ek - e0)
-            abs_deviation = max(abs_deviation, d)
-            rel_deviation = max(rel_deviation, d / denom)
-
-        max_rel.append(rel_deviation)
+        abs_deviation = float(np.abs(ke - e0).max())
+        max_rel.append(abs_deviation / denom)
         max_abs.append(abs_deviation)
 
     passed = all((r <= rel_tol) or (a <= abs_tol) for r, a in zip(max_rel, max_abs))
@@ -24,9 +24,13 @@ class Electron:
         self.velocity = velocity
 
     def translate(self, delta: Vector2) -> None:
-        """Shift position by a caller-provided displacement (no forces applied)."""
-        self.position = self.position + delta
+        """Shift position in place by a caller-provided displacement (no forces applied).
+
+        Mutates the existing position vector; callers snapshotting positions
+        should copy rather than hold the reference.
+        """
+        self.position.iadd(delta)
 
     def adjust_velocity(self, delta: Vector2) -> None:
-        """Increment velocity by a caller-provided change (physics applied elsewhere)."""
-        self.velocity = self.velocity + delta
+        """Increment velocity in place by a caller-provided change (physics applied elsewhere)."""
+        self.velocity.iadd(delta)
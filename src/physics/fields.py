@@ -1,36 +1,31 @@
 """Field models for electric and magnetic effects.
 
 Start with uniform fields but keep interfaces extensible for spatial or
-temporal variation.
+temporal variation. The base classes are plain duck-typed interfaces:
+subclasses just define `field_at`, and callers invoke it directly — no ABC
+metaclass machinery and no `__call__` forwarding frame on the force path.
 """
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from .vectors import Vector2, Vector3
 
 
-class ElectricField(ABC):
+class ElectricField:
     """Interface for 2D electric field models."""
 
-    @abstractmethod
     def field_at(self, time_s: float, position: Vector2) -> Vector2:
         """Return electric field (V/m) at a given time and position."""
+        raise NotImplementedError
 
-    def __call__(self, time_s: float, position: Vector2) -> Vector2:
-        return self.field_at(time_s, position)
 
-
-class MagneticField(ABC):
+class MagneticField:
     """Interface for 3D magnetic field models."""
 
-    @abstractmethod
     def field_at(self, time_s: float, position: Vector2) -> Vector3:
         """Return magnetic field (Tesla) at a given time and position."""
-
-    def __call__(self, time_s: float, position: Vector2) -> Vector3:
-        return self.field_at(time_s, position)
+        raise NotImplementedError
 
 
 @dataclass
@@ -42,6 +37,11 @@ class UniformElectricField(ElectricField):
     def field_at(self, time_s: float, position: Vector2) -> Vector2:  # noqa: ARG002
         return self.field
 
+    @property
+    def field_tuple(self) -> tuple[float, float]:
+        """Raw `(Ex, Ey)` components for callers that cache uniform values."""
+        return (self.field.x, self.field.y)
+
 
 @dataclass
 class UniformMagneticField(MagneticField):
@@ -51,3 +51,8 @@ class UniformMagneticField(MagneticField):
 
     def field_at(self, time_s: float, position: Vector2) -> Vector3:  # noqa: ARG002
         return self.field
+
+    @property
+    def field_tuple(self) -> tuple[float, float, float]:
+        """Raw `(Bx, By, Bz)` components for callers that cache uniform values."""
+        return (self.field.x, self.field.y, self.field.z)
@@ -1,13 +1,17 @@
 """Runge–Kutta 4 integrator for second-order motion.
 
 We track position and velocity; acceleration is supplied by a caller so the
-integrator stays reusable across force models.
+integrator stays reusable across force models. Batches of particles are
+advanced through the structure-of-arrays variant so the per-step work is a
+handful of NumPy array ops instead of per-particle Python dispatch.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Callable
 
+import numpy as np
+
 from .vectors import Vector2
 
 
@@ -20,9 +24,26 @@ class State:
 	velocity: Vector2
 
 
+@dataclass
+class BatchState:
+	"""Structure-of-arrays state for a batch of particles at a given time.
+
+	Positions and velocities are `(N, 2)` float64 arrays; row `i` belongs to
+	particle `i`. Keeping the components contiguous lets one RK4 step advance
+	every particle with vectorized arithmetic.
+	"""
+
+	time_s: float
+	positions: np.ndarray
+	velocities: np.ndarray
+
+
 # Acceleration provider: a(t, x, v) -> Vector2 (m/s^2)
 AccelerationFn = Callable[[float, Vector2, Vector2], Vector2]
 
+# Batched acceleration provider: a(t, positions, velocities) -> (N, 2) array (m/s^2)
+BatchAccelerationFn = Callable[[float, np.ndarray, np.ndarray], np.ndarray]
+
 
 def rk4_step(state: State, dt_s: float, acceleration_fn: AccelerationFn) -> State:
 	"""Advance state by one RK4 step.
@@ -64,3 +85,175 @@ def rk4_step(state: State, dt_s: float, acceleration_fn: AccelerationFn) -> Stat
 		position=new_position,
 		velocity=new_velocity,
 	)
+
+
+# Dormand–Prince 5(4) tableau: stage nodes, stage coupling, and the 5th/4th
+# order weights. The embedded 4th-order solution provides the error estimate.
+_DOPRI5_C = (0.0, 0.2, 0.3, 0.8, 8.0 / 9.0, 1.0, 1.0)
+_DOPRI5_A = (
+	(),
+	(0.2,),
+	(3.0 / 40.0, 9.0 / 40.0),
+	(44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0),
+	(19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0),
+	(9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0),
+	(35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0),
+)
+_DOPRI5_B5 = (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0, 0.0)
+_DOPRI5_B4 = (
+	5179.0 / 57600.0,
+	0.0,
+	7571.0 / 16695.0,
+	393.0 / 640.0,
+	-92097.0 / 339200.0,
+	187.0 / 2100.0,
+	1.0 / 40.0,
+)
+
+
+def rk45_step(
+	state: State,
+	dt_s: float,
+	acceleration_fn: AccelerationFn,
+	rtol: float = 1e-6,
+	atol: float = 1e-12,
+) -> tuple[State, float]:
+	"""Attempt one adaptive Dormand–Prince 5(4) step.
+
+	Returns `(new_state, suggested_dt)`. When the embedded error estimate
+	exceeds tolerance the input state is returned unchanged and the caller
+	should retry with the (smaller) suggested step; on acceptance the state
+	advances by `dt_s` and the suggestion may grow for quiet stretches. The
+	seventh stage equals the next step's first stage (FSAL); cross-step reuse
+	is left out to keep the interface stateless.
+	"""
+	y0 = (state.position.x, state.position.y, state.velocity.x, state.velocity.y)
+
+	stages: list[tuple[float, float, float, float]] = []
+	for stage in range(7):
+		y = list(y0)
+		for j, a in enumerate(_DOPRI5_A[stage]):
+			if a != 0.0:
+				kj = stages[j]
+				y[0] += dt_s * a * kj[0]
+				y[1] += dt_s * a * kj[1]
+				y[2] += dt_s * a * kj[2]
+				y[3] += dt_s * a * kj[3]
+		accel = acceleration_fn(
+			state.time_s + _DOPRI5_C[stage] * dt_s, Vector2(y[0], y[1]), Vector2(y[2], y[3])
+		)
+		stages.append((y[2], y[3], accel.x, accel.y))
+
+	y5 = [
+		y0[c] + dt_s * sum(_DOPRI5_B5[s] * stages[s][c] for s in range(7))
+		for c in range(4)
+	]
+	error = [
+		dt_s * sum((_DOPRI5_B5[s] - _DOPRI5_B4[s]) * stages[s][c] for s in range(7))
+		for c in range(4)
+	]
+
+	# Scaled RMS error norm: <= 1 means the step meets tolerance.
+	norm_sq = 0.0
+	for c in range(4):
+		scale = atol + rtol * max(abs(y0[c]), abs(y5[c]))
+		norm_sq += (error[c] / scale) ** 2
+	norm = (norm_sq / 4.0) ** 0.5
+
+	if norm > 0.0:
+		factor = min(5.0, max(0.2, 0.9 * norm ** -0.2))
+	else:
+		factor = 5.0
+	suggested_dt = dt_s * factor
+
+	if norm <= 1.0:
+		new_state = State(
+			time_s=state.time_s + dt_s,
+			position=Vector2(y5[0], y5[1]),
+			velocity=Vector2(y5[2], y5[3]),
+		)
+		return new_state, suggested_dt
+	return state, suggested_dt
+
+
+def boris_step(
+	state: State,
+	dt_s: float,
+	charge_c: float,
+	mass_kg: float,
+	electric_field,
+	magnetic_field,
+) -> State:
+	"""Advance state by one Boris (half-kick / rotate / half-kick) step.
+
+	The Boris pusher is the standard particle-in-field method: it is exactly
+	energy-conserving for uniform magnetic fields, so magnetic-only runs can
+	use much larger time steps than RK4 before drift appears — one field
+	evaluation per step instead of RK4's four. Stable `dt` is limited by
+	resolving the cyclotron period, not by energy drift. In this 2D model the
+	rotation uses only the out-of-plane `Bz` component, matching the planar
+	Lorentz force treatment.
+	"""
+	e_vec = electric_field.field_at(state.time_s, state.position)
+	b_vec = magnetic_field.field_at(state.time_s, state.position)
+
+	half_qm_dt = 0.5 * dt_s * charge_c / mass_kg
+
+	# Half electric kick
+	vmx = state.velocity.x + half_qm_dt * e_vec.x
+	vmy = state.velocity.y + half_qm_dt * e_vec.y
+
+	# Magnetic rotation: t and s are the out-of-plane rotation coefficients
+	t_z = half_qm_dt * b_vec.z
+	s_z = 2.0 * t_z / (1.0 + t_z * t_z)
+	vpx = vmx + vmy * t_z
+	vpy = vmy - vmx * t_z
+	vplus_x = vmx + vpy * s_z
+	vplus_y = vmy - vpx * s_z
+
+	# Second half electric kick
+	new_vx = vplus_x + half_qm_dt * e_vec.x
+	new_vy = vplus_y + half_qm_dt * e_vec.y
+
+	return State(
+		time_s=state.time_s + dt_s,
+		position=Vector2(state.position.x + new_vx * dt_s, state.position.y + new_vy * dt_s),
+		velocity=Vector2(new_vx, new_vy),
+	)
+
+
+def rk4_step_batch(
+	positions: np.ndarray,
+	velocities: np.ndarray,
+	time_s: float,
+	dt_s: float,
+	acceleration_fn: BatchAccelerationFn,
+) -> tuple[np.ndarray, np.ndarray]:
+	"""Advance all particles by one RK4 step in structure-of-arrays form.
+
+	Same Butcher tableau as `rk4_step`, but each stage operates on whole
+	`(N, 2)` arrays so the cost per particle is array arithmetic rather than
+	`Vector2` allocation and method dispatch.
+	"""
+	half_dt = 0.5 * dt_s
+
+	# Stage 1
+	k1_pos = velocities
+	k1_vel = acceleration_fn(time_s, positions, velocities)
+
+	# Stage 2
+	k2_pos = velocities + k1_vel * half_dt
+	k2_vel = acceleration_fn(time_s + half_dt, positions + k1_pos * half_dt, k2_pos)
+
+	# Stage 3
+	k3_pos = velocities + k2_vel * half_dt
+	k3_vel = acceleration_fn(time_s + half_dt, positions + k2_pos * half_dt, k3_pos)
+
+	# Stage 4
+	k4_pos = velocities + k3_vel * dt_s
+	k4_vel = acceleration_fn(time_s + dt_s, positions + k3_pos * dt_s, k4_pos)
+
+	sixth_dt = dt_s / 6.0
+	new_positions = positions + sixth_dt * (k1_pos + 2.0 * k2_pos + 2.0 * k3_pos + k4_pos)
+	new_velocities = velocities + sixth_dt * (k1_vel + 2.0 * k2_vel + 2.0 * k3_vel + k4_vel)
+	return new_positions, new_velocities
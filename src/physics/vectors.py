@@ -10,8 +10,12 @@ from math import hypot
 from typing import Iterable
 
 
-@dataclass(frozen=True)
+@dataclass
 class Vector2:
+	# Manual __slots__ keeps Python 3.9 support (dataclass slots=True is 3.10+)
+	# while giving C-level attribute offsets and a smaller per-instance footprint.
+	__slots__ = ("x", "y")
+
 	x: float
 	y: float
 
@@ -26,6 +30,16 @@ class Vector2:
 
 	__rmul__ = __mul__
 
+	def iadd(self, other: "Vector2") -> None:
+		"""Add another vector in place, avoiding a fresh allocation."""
+		self.x += other.x
+		self.y += other.y
+
+	def imul(self, scalar: float) -> None:
+		"""Scale this vector in place, avoiding a fresh allocation."""
+		self.x *= scalar
+		self.y *= scalar
+
 	def magnitude(self) -> float:
 		return hypot(self.x, self.y)
 
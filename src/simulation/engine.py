@@ -1,25 +1,70 @@
 """Simulation engine advancing electrons under Lorentz force using RK4.
 
 RK4 is used instead of Euler to curb numerical drift in rotating systems and
-keep trajectories stable without requiring extremely small time steps.
+keep trajectories stable without requiring extremely small time steps. State
+is held in structure-of-arrays NumPy buffers so each step advances every
+electron at once; `State`/`Vector2` objects are only materialized when
+recording trajectory samples or handing results back to callers.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import List, Sequence, Tuple
 
-from ..physics import AccelerationFn, ElectricField, Electron, MagneticField, State, Vector2, lorentz_force, rk4_step
+import numpy as np
+
+from ..physics import (
+	AccelerationFn,
+	BatchAccelerationFn,
+	ElectricField,
+	Electron,
+	MagneticField,
+	State,
+	UniformElectricField,
+	UniformMagneticField,
+	Vector2,
+	boris_step,
+	lorentz_force,
+	rk4_step_batch,
+	rk45_step,
+)
+from ..physics._rk4_numba import rk4_step_bz
+
+# Electron count up to which the compiled scalar uniform-Bz kernel beats the
+# vectorized batch integrator. The kernel's per-electron Python loop of native
+# calls scales linearly with N while the batch path amortizes across the whole
+# array; measured crossover is around 50 electrons.
+NUMBA_SCALAR_MAX_ELECTRONS = 32
 
 
 @dataclass
 class SimulationConfig:
-	"""Simulation timing configuration."""
+	"""Simulation timing configuration.
+
+	`parallel` > 1 integrates electrons across that many worker processes;
+	each electron evolves independently, so the split is embarrassingly
+	parallel and useful for large offline sweeps.
+
+	`integrator` selects the stepping scheme: "rk4" (default), "boris", or
+	"dopri5". Boris is exactly energy-conserving for uniform B, so
+	magnetic-only runs tolerate much larger time steps at one field
+	evaluation per step. "dopri5" is the adaptive Dormand–Prince 5(4) pair:
+	`time_step_s` is only the initial step, and the local step grows or
+	shrinks to hold the error estimate within `rtol`/`atol` — cheap in quiet
+	stretches without globally shrinking the step for stiff regions.
+	"""
 
 	time_step_s: float
 	total_time_s: float
 	record_trajectory: bool = True
+	parallel: int = 1
+	integrator: str = "rk4"
+	rtol: float = 1e-6
+	atol: float = 1e-12
 
 	def steps(self) -> int:
+		"""Fixed-step count; adaptive integrators choose their own steps."""
 		return int(self.total_time_s / self.time_step_s)
 
 
@@ -31,18 +76,231 @@ class SimulationResult:
 	trajectories: List[List[State]]
 
 
+def _integrate_chunk(
+	args: Tuple[ElectricField, MagneticField, List[Electron], "SimulationConfig", float],
+) -> "SimulationResult":
+	"""Worker entry point: integrate a slice of electrons in a child process.
+
+	Module-level so it pickles cleanly; fields and electrons are plain
+	dataclasses and travel to the worker by value.
+	"""
+	electric_field, magnetic_field, electrons, config, start_time_s = args
+	engine = SimulationEngine(electric_field, magnetic_field)
+	return engine.run(electrons, config, start_time_s=start_time_s)
+
+
 class SimulationEngine:
 	"""Advances one or more electrons through time under given fields."""
 
 	def __init__(self, electric_field: ElectricField, magnetic_field: MagneticField):
 		self._electric_field = electric_field
 		self._magnetic_field = magnetic_field
+		# Uniform fields ignore time and position, so the Lorentz acceleration
+		# collapses to a closed form per electron; detect that shape once here.
+		self._uniform_fields = isinstance(electric_field, UniformElectricField) and isinstance(
+			magnetic_field, UniformMagneticField
+		)
+
+	def _uniform_bz_coefficients(
+		self, electrons: Sequence[Electron]
+	) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+		"""Return per-electron `(qEx/m, qEy/m, qBz/m)` arrays for uniform fields.
+
+		With uniform fields and B = (0, 0, Bz), acceleration reduces to
+		`ax = qEx/m + wz*vy; ay = qEy/m - wz*vx` with cyclotron rate
+		`wz = qBz/m` — no field dispatch and no intermediate vectors. Field
+		values are read here (not at engine construction) because the uniform
+		field dataclasses are mutable and adjusted interactively by the UI.
+		Returns None when the configuration does not fit the fast path.
+		"""
+		if not self._uniform_fields:
+			return None
+		b_vec = self._magnetic_field.field
+		if b_vec.x != 0.0 or b_vec.y != 0.0:
+			return None
+		e_vec = self._electric_field.field
+
+		q_over_m = np.array([e.charge_c / e.mass_kg for e in electrons], dtype=np.float64)
+		return q_over_m * e_vec.x, q_over_m * e_vec.y, q_over_m * b_vec.z
+
+	def _uniform_bz_acceleration_fn(self, electrons: Sequence[Electron]) -> BatchAccelerationFn | None:
+		"""Build the closed-form batched acceleration for uniform E and Bz."""
+		coefficients = self._uniform_bz_coefficients(electrons)
+		if coefficients is None:
+			return None
+		ex_qm, ey_qm, wz = coefficients
+
+		def accel(time_s: float, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:  # noqa: ARG001
+			out = np.empty_like(velocities)
+			out[:, 0] = ex_qm + wz * velocities[:, 1]
+			out[:, 1] = ey_qm - wz * velocities[:, 0]
+			return out
+
+		return accel
+
+	def _batch_acceleration_fn(self, electrons: Sequence[Electron]) -> BatchAccelerationFn:
+		"""Create a batched acceleration function bound to a set of electrons.
+
+		Prefers the closed-form uniform-Bz path when the field configuration
+		allows it; otherwise fields may vary in space and time, so each
+		electron is evaluated at its own position and results are packed into
+		one `(N, 2)` array per call.
+		"""
+		fast_path = self._uniform_bz_acceleration_fn(electrons)
+		if fast_path is not None:
+			return fast_path
+
+		electric = self._electric_field
+		magnetic = self._magnetic_field
+		uniform_e = isinstance(electric, UniformElectricField)
+		uniform_b = isinstance(magnetic, UniformMagneticField)
+
+		if uniform_e or uniform_b:
+			# Mixed configuration: at least one field is uniform, so its
+			# components are read once per acceleration call instead of being
+			# dispatched per electron; only the in-plane force terms survive,
+			# which need just (Ex, Ey) and Bz.
+			def accel(time_s: float, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+				out = np.empty_like(velocities)
+				ex, ey = electric.field_tuple if uniform_e else (0.0, 0.0)
+				bz = magnetic.field_tuple[2] if uniform_b else 0.0
+				for i, electron in enumerate(electrons):
+					position = Vector2(positions[i, 0], positions[i, 1])
+					if not uniform_e:
+						e_vec = electric.field_at(time_s, position)
+						ex, ey = e_vec.x, e_vec.y
+					if not uniform_b:
+						bz = magnetic.field_at(time_s, position).z
+					vx, vy = velocities[i, 0], velocities[i, 1]
+					q_over_m = electron.charge_c / electron.mass_kg
+					out[i, 0] = q_over_m * (ex + vy * bz)
+					out[i, 1] = q_over_m * (ey - vx * bz)
+				return out
+
+			return accel
+
+		def accel(time_s: float, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+			out = np.empty_like(velocities)
+			for i, electron in enumerate(electrons):
+				fx, fy = lorentz_force(
+					charge_c=electron.charge_c,
+					velocity=Vector2(velocities[i, 0], velocities[i, 1]),
+					electric_field=self._electric_field,
+					magnetic_field=self._magnetic_field,
+					time_s=time_s,
+					position=Vector2(positions[i, 0], positions[i, 1]),
+				)
+				out[i, 0] = fx / electron.mass_kg
+				out[i, 1] = fy / electron.mass_kg
+			return out
+
+		return accel
+
+	def run(self, electrons: Sequence[Electron], config: SimulationConfig, start_time_s: float = 0.0) -> SimulationResult:
+		if config.time_step_s <= 0:
+			raise ValueError("time_step_s must be positive")
+		if config.total_time_s <= 0:
+			raise ValueError("total_time_s must be positive")
+		if config.integrator not in ("rk4", "boris", "dopri5"):
+			raise ValueError(f"unknown integrator: {config.integrator!r}")
+
+		if config.parallel > 1 and len(electrons) > 1:
+			return self._run_parallel(electrons, config, start_time_s)
+		if config.integrator == "dopri5":
+			return self._run_adaptive(electrons, config, start_time_s)
 
-	def _acceleration_fn(self, electron: Electron) -> AccelerationFn:
-		"""Create an acceleration closure bound to a specific electron."""
+		# Pack electron kinematics into (N, 2) structure-of-arrays buffers.
+		positions = np.array([e.position.to_tuple() for e in electrons], dtype=np.float64).reshape(-1, 2)
+		velocities = np.array([e.velocity.to_tuple() for e in electrons], dtype=np.float64).reshape(-1, 2)
+		time_s = start_time_s
+
+		# Hoist config reads and bound methods out of the step loops; each is a
+		# LOAD_ATTR (or method lookup) per iteration otherwise, and the loops
+		# run steps x electrons times.
+		steps = config.steps()
+		dt_s = config.time_step_s
+		record = config.record_trajectory
+
+		# Recording writes raw floats into one preallocated tensor indexed as
+		# [step, electron, pos/vel, component]; State objects are materialized
+		# once after the loop instead of per step, so the hot loop never grows
+		# Python lists or allocates sample objects.
+		n_electrons = len(electrons)
+		trajectory_buf = np.empty((steps + 1, n_electrons, 2, 2), dtype=np.float64) if record else None
+		if trajectory_buf is not None:
+			trajectory_buf[0, :, 0] = positions
+			trajectory_buf[0, :, 1] = velocities
+
+		# The scalar kernel only pays off for small interactive batches; past
+		# the crossover its per-electron call loop loses to the batch path.
+		coefficients = (
+			self._uniform_bz_coefficients(electrons)
+			if config.integrator == "rk4"
+			and rk4_step_bz is not None
+			and n_electrons <= NUMBA_SCALAR_MAX_ELECTRONS
+			else None
+		)
+
+		if config.integrator == "boris":
+			e_field, b_field = self._electric_field, self._magnetic_field
+			for idx, electron in enumerate(electrons):
+				state = State(
+					time_s=start_time_s,
+					position=Vector2(positions[idx, 0], positions[idx, 1]),
+					velocity=Vector2(velocities[idx, 0], velocities[idx, 1]),
+				)
+				for step in range(steps):
+					state = boris_step(state, dt_s, electron.charge_c, electron.mass_kg, e_field, b_field)
+					if record:
+						trajectory_buf[step + 1, idx, 0] = (state.position.x, state.position.y)
+						trajectory_buf[step + 1, idx, 1] = (state.velocity.x, state.velocity.y)
+				positions[idx] = (state.position.x, state.position.y)
+				velocities[idx] = (state.velocity.x, state.velocity.y)
+			time_s = start_time_s + steps * dt_s
+		elif coefficients is not None:
+			# Compiled scalar kernel: each step is one call into native code
+			# with no array temporaries — the win for small interactive batches.
+			ex_qm, ey_qm, wz = coefficients
+			step_bz = rk4_step_bz
+			for idx in range(n_electrons):
+				px, py = positions[idx, 0], positions[idx, 1]
+				vx, vy = velocities[idx, 0], velocities[idx, 1]
+				ex_i, ey_i, wz_i = ex_qm[idx], ey_qm[idx], wz[idx]
+				for step in range(steps):
+					px, py, vx, vy = step_bz(px, py, vx, vy, dt_s, ex_i, ey_i, wz_i)
+					if record:
+						trajectory_buf[step + 1, idx, 0, 0] = px
+						trajectory_buf[step + 1, idx, 0, 1] = py
+						trajectory_buf[step + 1, idx, 1, 0] = vx
+						trajectory_buf[step + 1, idx, 1, 1] = vy
+				positions[idx, 0], positions[idx, 1] = px, py
+				velocities[idx, 0], velocities[idx, 1] = vx, vy
+			time_s = start_time_s + steps * dt_s
+		else:
+			acceleration_fn = self._batch_acceleration_fn(electrons)
+			step_batch = rk4_step_batch
+			for step in range(steps):
+				positions, velocities = step_batch(positions, velocities, time_s, dt_s, acceleration_fn)
+				time_s += dt_s
+				if record:
+					trajectory_buf[step + 1, :, 0] = positions
+					trajectory_buf[step + 1, :, 1] = velocities
+
+		trajectories = self._wrap_trajectories(trajectory_buf, start_time_s, dt_s, n_electrons)
+		final_states = [self._sample(time_s, positions, velocities, idx) for idx in range(n_electrons)]
+
+		# Propagate final integrator state back into electron objects.
+		for electron, state in zip(electrons, final_states):
+			electron.position = state.position
+			electron.velocity = state.velocity
+
+		return SimulationResult(final_states=final_states, trajectories=trajectories)
+
+	def _scalar_acceleration_fn(self, electron: Electron) -> AccelerationFn:
+		"""Create an acceleration closure bound to a single electron."""
 
 		def accel(time_s: float, position: Vector2, velocity: Vector2) -> Vector2:
-			force = lorentz_force(
+			fx, fy = lorentz_force(
 				charge_c=electron.charge_c,
 				velocity=velocity,
 				electric_field=self._electric_field,
@@ -50,33 +308,103 @@ class SimulationEngine:
 				time_s=time_s,
 				position=position,
 			)
-			return Vector2(force.x / electron.mass_kg, force.y / electron.mass_kg)
+			return Vector2(fx / electron.mass_kg, fy / electron.mass_kg)
 
 		return accel
 
-	def run(self, electrons: Sequence[Electron], config: SimulationConfig, start_time_s: float = 0.0) -> SimulationResult:
-		if config.time_step_s <= 0:
-			raise ValueError("time_step_s must be positive")
-		if config.total_time_s <= 0:
-			raise ValueError("total_time_s must be positive")
+	def _run_adaptive(
+		self, electrons: Sequence[Electron], config: SimulationConfig, start_time_s: float
+	) -> SimulationResult:
+		"""Integrate with the adaptive Dormand–Prince 5(4) stepper.
+
+		Each electron advances through its own step-size history, so sample
+		counts differ between trajectories; `config.time_step_s` seeds the
+		first attempt and subsequent steps track the local error estimate.
+		"""
+		end_time_s = start_time_s + config.total_time_s
+		final_states: List[State] = []
+		trajectories: List[List[State]] = []
+
+		for electron in electrons:
+			accel = self._scalar_acceleration_fn(electron)
+			state = State(time_s=start_time_s, position=electron.position, velocity=electron.velocity)
+			trajectory: List[State] = [state] if config.record_trajectory else []
+			dt_s = config.time_step_s
+
+			while state.time_s < end_time_s:
+				attempt_dt = min(dt_s, end_time_s - state.time_s)
+				new_state, dt_s = rk45_step(state, attempt_dt, accel, config.rtol, config.atol)
+				if new_state.time_s > state.time_s:
+					state = new_state
+					if config.record_trajectory:
+						trajectory.append(state)
+				elif dt_s < 1e-6 * config.time_step_s:
+					raise RuntimeError("dopri5 step size underflow; tolerances may be too tight")
+
+			final_states.append(state)
+			trajectories.append(trajectory)
+
+		for electron, state in zip(electrons, final_states):
+			electron.position = state.position
+			electron.velocity = state.velocity
+
+		return SimulationResult(final_states=final_states, trajectories=trajectories)
 
-		# Initialize integrator state per electron.
-		states: List[State] = [
-			State(time_s=start_time_s, position=e.position, velocity=e.velocity) for e in electrons
+	def _run_parallel(
+		self, electrons: Sequence[Electron], config: SimulationConfig, start_time_s: float
+	) -> SimulationResult:
+		"""Integrate contiguous chunks of electrons across worker processes.
+
+		Workers receive copies of the electrons, so final states are written
+		back to the caller's objects here after the results are merged.
+		"""
+		worker_config = replace(config, parallel=1)
+		n_workers = min(config.parallel, len(electrons))
+		bounds = np.linspace(0, len(electrons), n_workers + 1, dtype=int)
+		jobs = [
+			(self._electric_field, self._magnetic_field, list(electrons[lo:hi]), worker_config, start_time_s)
+			for lo, hi in zip(bounds[:-1], bounds[1:])
+			if hi > lo
 		]
-		trajectories: List[List[State]] = [[s] if config.record_trajectory else [] for s in states]
-		acceleration_fns: List[AccelerationFn] = [self._acceleration_fn(e) for e in electrons]
 
-		for _ in range(config.steps()):
-			for idx, state in enumerate(states):
-				next_state = rk4_step(state, config.time_step_s, acceleration_fns[idx])
-				states[idx] = next_state
-				if config.record_trajectory:
-					trajectories[idx].append(next_state)
+		final_states: List[State] = []
+		trajectories: List[List[State]] = []
+		with ProcessPoolExecutor(max_workers=n_workers) as pool:
+			for chunk_result in pool.map(_integrate_chunk, jobs):
+				final_states.extend(chunk_result.final_states)
+				trajectories.extend(chunk_result.trajectories)
 
-		# Propagate final integrator state back into electron objects.
-		for electron, state in zip(electrons, states):
+		for electron, state in zip(electrons, final_states):
 			electron.position = state.position
 			electron.velocity = state.velocity
 
-		return SimulationResult(final_states=states, trajectories=trajectories)
+		return SimulationResult(final_states=final_states, trajectories=trajectories)
+
+	@staticmethod
+	def _wrap_trajectories(
+		trajectory_buf: np.ndarray | None, start_time_s: float, dt_s: float, n_electrons: int
+	) -> List[List[State]]:
+		"""Materialize per-electron `State` lists from the recorded tensor."""
+		if trajectory_buf is None:
+			return [[] for _ in range(n_electrons)]
+		n_samples = trajectory_buf.shape[0]
+		return [
+			[
+				State(
+					time_s=start_time_s + k * dt_s,
+					position=Vector2(trajectory_buf[k, idx, 0, 0], trajectory_buf[k, idx, 0, 1]),
+					velocity=Vector2(trajectory_buf[k, idx, 1, 0], trajectory_buf[k, idx, 1, 1]),
+				)
+				for k in range(n_samples)
+			]
+			for idx in range(n_electrons)
+		]
+
+	@staticmethod
+	def _sample(time_s: float, positions: np.ndarray, velocities: np.ndarray, idx: int) -> State:
+		"""Materialize a `State` snapshot for one electron from the array buffers."""
+		return State(
+			time_s=time_s,
+			position=Vector2(positions[idx, 0], positions[idx, 1]),
+			velocity=Vector2(velocities[idx, 0], velocities[idx, 1]),
+		)
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import threading
+from queue import Empty, SimpleQueue
 from typing import Optional
 
+import numpy as np
+
 from ..physics import (
     ELECTRON_CHARGE_COULOMBS,
     ELECTRON_MASS_KG,
@@ -28,6 +32,14 @@ def run_interactive_simulation(
 
     Time step is fixed for physics; frame time controls visualization framerate.
     Keyboard input adjusts E, B, and electron velocities in real time.
+
+    Physics runs on a background thread so integration and rendering overlap
+    on multi-core machines; all Pygame calls stay on this (main) thread, as
+    SDL requires. The threads meet at a double-buffered position snapshot:
+    the worker fills the inactive buffer and flips an index, the render loop
+    reads whichever buffer the index points at, and input adjustments travel
+    back over a command queue so only the worker ever mutates the electrons
+    and the engine's fields.
     """
     visualizer_config = VisualizerConfig(fps=30)
     visualizer = Visualizer(visualizer_config)
@@ -41,56 +53,169 @@ def run_interactive_simulation(
     initial_b_field = Vector3(magnetic_field_tesla.x, magnetic_field_tesla.y, magnetic_field_tesla.z)
     initial_positions = [Vector2(e.position.x, e.position.y) for e in electrons]
     initial_velocities = [Vector2(e.velocity.x, e.velocity.y) for e in electrons]
-    
+
     e_field = UniformElectricField(current_e_field)
     b_field = UniformMagneticField(current_b_field)
     engine = SimulationEngine(e_field, b_field)
 
-    current_time = 0.0
-    running = True
+    frame_steps = max(1, int(max_frame_time_s / time_step_s))
+    frame_config = SimulationConfig(
+        time_step_s=time_step_s,
+        total_time_s=frame_steps * time_step_s,
+        record_trajectory=False,
+    )
+
+    # Double-buffered snapshot shared between the threads. The worker writes
+    # positions into buffer `1 - index`, then publishes by storing the new
+    # index; flipping after the write means the reader always sees a fully
+    # written buffer. Buffer 0 starts as the initial conditions.
+    snapshots = np.empty((2, len(electrons), 2), dtype=np.float64)
+    snapshot_times = [0.0, 0.0]
+    snapshot_index = [0]
+    # Reset generation, published with each snapshot. The render loop clears
+    # trails only when it first sees a snapshot from a new generation, so an
+    # in-flight pre-reset frame cannot append a stale position into freshly
+    # cleared trails and drag a spurious line back to the origin.
+    snapshot_generations = [0, 0]
+    for i, electron in enumerate(electrons):
+        snapshots[0, i, 0] = electron.position.x
+        snapshots[0, i, 1] = electron.position.y
+    frame_ready = threading.Event()
+    # Backpressure handshake: the worker integrates one frame budget per
+    # snapshot the render loop has consumed, so simulation time advances at
+    # max_frame_time_s per rendered frame rather than as fast as the core
+    # can spin. Starts set so the first frame integrates immediately.
+    consumed = threading.Event()
+    consumed.set()
+    stop = threading.Event()
+    commands: SimpleQueue = SimpleQueue()
+
+    def physics_loop() -> None:
+        current_time = 0.0
+        generation = 0
+        while not stop.is_set():
+            # Apply queued input adjustments; the worker is the only thread
+            # that touches the electrons and the engine's field objects.
+            while True:
+                try:
+                    command, payload = commands.get_nowait()
+                except Empty:
+                    break
+                if command == 'reset':
+                    current_time = 0.0
+                    generation += 1
+                    e_field.field = Vector2(initial_e_field.x, initial_e_field.y)
+                    b_field.field = Vector3(
+                        initial_b_field.x, initial_b_field.y, initial_b_field.z
+                    )
+                    for i, electron in enumerate(electrons):
+                        electron.position = Vector2(
+                            initial_positions[i].x, initial_positions[i].y
+                        )
+                        electron.velocity = Vector2(
+                            initial_velocities[i].x, initial_velocities[i].y
+                        )
+                elif command == 'b_adjust':
+                    old = b_field.field
+                    b_field.field = Vector3(old.x, old.y, old.z + payload)
+                elif command == 'v_adjust':
+                    dvx, dvy = payload
+                    for electron in electrons:
+                        electron.velocity = Vector2(
+                            electron.velocity.x + dvx, electron.velocity.y + dvy
+                        )
+
+            if visualizer.paused:
+                stop.wait(0.005)
+                continue
+
+            # Wait for the renderer to consume the last snapshot before
+            # advancing; the timeout keeps the loop responsive to stop,
+            # pause, and queued commands.
+            if not consumed.wait(timeout=0.05):
+                continue
+            consumed.clear()
+
+            result = engine.run(electrons, frame_config, start_time_s=current_time)
+            if result.final_states:
+                current_time = result.final_states[0].time_s
+
+            back = 1 - snapshot_index[0]
+            for i, electron in enumerate(electrons):
+                snapshots[back, i, 0] = electron.position.x
+                snapshots[back, i, 1] = electron.position.y
+            snapshot_times[back] = current_time
+            snapshot_generations[back] = generation
+            snapshot_index[0] = back
+            frame_ready.set()
+
+    worker = threading.Thread(target=physics_loop, name="physics", daemon=True)
+    worker.start()
+
+    # Render-side stand-ins: the visualizer reads positions only, and these
+    # are refreshed from the snapshot so the live electrons are never read
+    # while the worker integrates them.
+    display_electrons = [
+        Electron(
+            position=Vector2(e.position.x, e.position.y),
+            velocity=Vector2(e.velocity.x, e.velocity.y),
+            mass_kg=e.mass_kg,
+            charge_c=e.charge_c,
+        )
+        for e in electrons
+    ]
 
+    running = True
+    displayed_generation = 0
     try:
         while running:
-            # Step forward by frame time (skip if paused)
-            if not visualizer.paused:
-                frame_steps = max(1, int(max_frame_time_s / time_step_s))
-                frame_config = SimulationConfig(
-                    time_step_s=time_step_s,
-                    total_time_s=frame_steps * time_step_s,
-                    record_trajectory=False,
-                )
-
-                result = engine.run(electrons, frame_config, start_time_s=current_time)
-                current_time = result.final_states[0].time_s if result.final_states else current_time
-
-            # Render and get input adjustments
-            running, input_dict = visualizer.render(electrons, current_time, current_e_field, current_b_field.z)
-
-            # Reset to initial conditions
+            # Wait briefly for a fresh physics frame, but render regardless
+            # so input stays responsive when physics is slow or paused.
+            frame_ready.wait(timeout=1.0 / visualizer_config.fps)
+            frame_ready.clear()
+
+            front = snapshot_index[0]
+            # First snapshot of a new reset generation: drop the old trails
+            # before this frame's positions are appended to them.
+            if snapshot_generations[front] != displayed_generation:
+                displayed_generation = snapshot_generations[front]
+                visualizer.clear_trails()
+            for i, display in enumerate(display_electrons):
+                display.position = Vector2(snapshots[front, i, 0], snapshots[front, i, 1])
+            snapshot_time = snapshot_times[front]
+            # Snapshot consumed: let the worker integrate the next frame
+            # budget while this one renders.
+            consumed.set()
+
+            running, input_dict = visualizer.render(
+                display_electrons, snapshot_time, current_e_field, current_b_field.z
+            )
+
+            # Forward adjustments to the worker; the local field copies are
+            # updated in step so the status readout tracks them immediately.
+            # Trail clearing waits for the first post-reset snapshot (see the
+            # generation check above), since the worker may still publish an
+            # in-flight pre-reset frame.
             if input_dict.get('reset'):
-                current_time = 0.0
                 current_e_field = Vector2(initial_e_field.x, initial_e_field.y)
-                current_b_field = Vector3(initial_b_field.x, initial_b_field.y, initial_b_field.z)
-                e_field.field = current_e_field
-                b_field.field = current_b_field
-                for i, electron in enumerate(electrons):
-                    electron.position = Vector2(initial_positions[i].x, initial_positions[i].y)
-                    electron.velocity = Vector2(initial_velocities[i].x, initial_velocities[i].y)
-                visualizer.clear_trails()
+                current_b_field = Vector3(
+                    initial_b_field.x, initial_b_field.y, initial_b_field.z
+                )
+                commands.put(('reset', None))
 
-            # Apply B-field adjustment (incremental)
             if input_dict.get('b_adjust'):
                 db = input_dict['b_adjust']
-                current_b_field = Vector3(current_b_field.x, current_b_field.y, current_b_field.z + db)
-                b_field.field = current_b_field
+                current_b_field = Vector3(
+                    current_b_field.x, current_b_field.y, current_b_field.z + db
+                )
+                commands.put(('b_adjust', db))
 
-            # Apply velocity adjustments
             if input_dict.get('v_adjust'):
-                dvx, dvy = input_dict['v_adjust']
-                for electron in electrons:
-                    electron.velocity = Vector2(electron.velocity.x + dvx, electron.velocity.y + dvy)
+                commands.put(('v_adjust', input_dict['v_adjust']))
 
     finally:
+        stop.set()
+        worker.join(timeout=2.0)
         visualizer.shutdown()
 
 
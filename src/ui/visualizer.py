@@ -7,9 +7,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from ..physics import Electron, Vector2
+from .visualizer_kernels import stamp_sprites, trails_to_pixels
 
 
 Color = Tuple[int, int, int]
@@ -20,6 +22,53 @@ COLOR_ELECTRON = (0, 200, 255)  # Bright cyan for current position
 COLOR_TRAIL = (100, 150, 200)  # Softer blue for trails
 COLOR_TEXT = (200, 200, 200)  # Light gray for text
 
+# How often (in frames) the persistent trail surface is redrawn from the ring
+# buffers once trails have started evicting points. Between redraws, evicted
+# segments are erased with background-colored lines, which can nick pixels
+# where trails overlap; the periodic redraw repairs that.
+TRAIL_REDRAW_INTERVAL_FRAMES = 30
+
+# Electron count at which sprite drawing switches from per-electron blits to
+# the compiled framebuffer-stamping kernel. For small counts SDL's blit wins;
+# past this the single parallel memory pass does.
+SPRITE_STAMP_MIN_ELECTRONS = 64
+
+
+def _segment_rect(apx: int, apy: int, bpx: int, bpy: int) -> pygame.Rect:
+    """Bounding rect of one pixel-space line segment, slightly inflated."""
+    rect = pygame.Rect(min(apx, bpx), min(apy, bpy), abs(apx - bpx) + 1, abs(apy - bpy) + 1)
+    return rect.inflate(2, 2)
+
+
+@dataclass
+class TrailBuffer:
+    """Preallocated ring buffer of world-space trail points.
+
+    Appends overwrite the oldest slot in place, so a full trail costs zero
+    allocations per frame and the storage stays contiguous for vectorized
+    pixel conversion.
+    """
+
+    buffer: np.ndarray  # (capacity, 2) world coordinates
+    head: int = 0  # next write slot
+    count: int = 0
+
+    def append(self, x: float, y: float) -> None:
+        self.buffer[self.head, 0] = x
+        self.buffer[self.head, 1] = y
+        self.head = (self.head + 1) % len(self.buffer)
+        self.count = min(self.count + 1, len(self.buffer))
+
+    def as_array(self) -> np.ndarray:
+        """Return points oldest-to-newest; zero-copy until the ring wraps."""
+        if self.count < len(self.buffer):
+            return self.buffer[: self.count]
+        return np.concatenate((self.buffer[self.head :], self.buffer[: self.head]))
+
+    def clear(self) -> None:
+        self.head = 0
+        self.count = 0
+
 
 @dataclass
 class VisualizerConfig:
@@ -31,6 +80,14 @@ class VisualizerConfig:
     pixel_scale_m: float = 1e7  # meters per pixel (adjusted for electron cyclotron motion)
     electron_radius_px: int = 5
     max_trail_points: int = 500
+    # Draw trails with anti-aliased lines. Smoother at high zoom, but the
+    # blended rasterizer is slower than the 1-px Bresenham path.
+    antialias: bool = False
+    # Frame pacing: plain Clock.tick sleeps off the frame budget, yielding
+    # the CPU to the OS but with millisecond-granular wakeups; tick_busy_loop
+    # spin-waits for exact pacing at the cost of a fully busy core. Leave off
+    # unless frame-time jitter actually matters.
+    busy_loop: bool = False
 
 
 class Visualizer:
@@ -44,11 +101,64 @@ class Visualizer:
         self.small_font: Optional[pygame.font.Font] = None
         self.running = False
         self.paused = False
-        self.trails: dict[int, List[Vector2]] = {}  # Per-electron trail by id()
+        # Per-electron trail, indexed by render order; each ring buffer
+        # overwrites its oldest slot in place once full. All buffers are row
+        # views into one contiguous registry array (see register_electrons).
+        self.trails: List[TrailBuffer] = []
+        self._trail_registry: Optional[np.ndarray] = None
+        # Scratch arrays for the Numba pixel-conversion kernel: per-trail
+        # head/count descriptors plus the int32 output block, all preallocated
+        # alongside the registry so the per-frame kernel call allocates nothing.
+        self._trail_heads: Optional[np.ndarray] = None
+        self._trail_counts: Optional[np.ndarray] = None
+        self._pixel_scratch: Optional[np.ndarray] = None
+        # Snapshot of the world layer (background + trails + electrons) taken
+        # on the first paused frame; while paused, frames reuse it with one
+        # blit instead of re-rasterizing every trail.
+        self._paused_cache: Optional[pygame.Surface] = None
+        # Electron glyph prerendered once at initialize(); drawing is then an
+        # alpha blit per electron instead of a circle rasterization.
+        self._electron_sprite: Optional[pygame.Surface] = None
+        # Background surface filled once at initialize() and blitted to clear
+        # the frame, rather than re-filling the framebuffer each frame.
+        self._background: Optional[pygame.Surface] = None
+        # RGB block and circular footprint of the electron glyph, used by the
+        # framebuffer-stamping kernel when there are many electrons.
+        self._sprite_stamp: Optional[np.ndarray] = None
+        self._sprite_mask: Optional[np.ndarray] = None
+        # Persistent trail layer: background plus every trail already drawn.
+        # Each frame adds only the newest segment per electron, so trail cost
+        # is O(electrons) per frame instead of O(electrons x trail length);
+        # the layer doubles as the frame's base blit.
+        self._trail_surface: Optional[pygame.Surface] = None
+        self._frames_since_trail_redraw = 0
+        self._trail_surface_stale = False
+        # Dirty-rectangle presentation state: regions the previous frame drew
+        # sprites and status text into, plus a flag forcing a full flip after
+        # anything that invalidates the whole display (startup, trail clears,
+        # overlay toggles).
+        self._prev_sprite_rects: List[pygame.Rect] = []
+        self._prev_status_rects: List[pygame.Rect] = []
+        self._needs_full_update = True
+        # Font rasterization caches: the help overlay is static and rendered
+        # once; status lines recur (values are formatted to few significant
+        # digits) and are cached by their text with a size cap against churn.
+        self._help_surface: Optional[pygame.Surface] = None
+        self._status_cache: dict[str, pygame.Surface] = {}
+        # The time line changes nearly every frame, so it gets a last-value
+        # cache instead of churning the keyed status cache: re-render only
+        # when the formatted string actually differs from the previous frame.
+        self._last_time_text: Optional[str] = None
+        self._last_time_surf: Optional[pygame.Surface] = None
         self.show_help = True
         # Adjustment factors for interactive controls
         self.b_adjust_factor = 0.02  # T per keypress
         self.v_adjust_factor = 2e4  # m/s per keypress
+        # World-to-pixel transform constants, cached once so the per-frame
+        # conversions skip repeated config attribute lookups.
+        self._cx = config.window_width / 2
+        self._cy = config.window_height / 2
+        self._scale = config.pixel_scale_m
 
     def initialize(self) -> None:
         """Set up Pygame window and resources."""
@@ -56,8 +166,52 @@ class Visualizer:
         self.screen = pygame.display.set_mode((self.config.window_width, self.config.window_height))
         pygame.display.set_caption("Electron Dynamics Simulator")
         self.clock = pygame.time.Clock()
+        # Filter events at the SDL layer: the input handler only consumes
+        # window-close and key-press events, so everything else (notably
+        # high-rate mouse motion) is dropped before a Python event object is
+        # ever allocated for it.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        # Every surface blitted per frame must be in the display's pixel
+        # format — .convert() for opaque, .convert_alpha() for alpha — or SDL
+        # falls off the memcpy/SIMD blit path into per-pixel format conversion
+        # on every blit. New surfaces added here should follow suit.
+        self._background = pygame.Surface(self.screen.get_size()).convert()
+        self._background.fill(COLOR_BG)
+        self._trail_surface = pygame.Surface(self.screen.get_size()).convert()
+        self._trail_surface.blit(self._background, (0, 0))
+        radius = self.config.electron_radius_px
+        self._electron_sprite = pygame.Surface(
+            (2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA
+        ).convert_alpha()
+        pygame.draw.circle(self._electron_sprite, COLOR_ELECTRON, (radius, radius), radius)
+        size = 2 * radius + 1
+        offsets = np.arange(size) - radius
+        self._sprite_mask = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+        self._sprite_stamp = np.empty((size, size, 3), dtype=np.uint8)
+        self._sprite_stamp[:, :] = COLOR_ELECTRON
+        if trails_to_pixels is not None:
+            # Warm up the JIT on a tiny input so the one-time compile happens
+            # here instead of stalling the first rendered frame.
+            trails_to_pixels(
+                np.zeros((1, 2, 2), dtype=np.float64),
+                np.zeros(1, dtype=np.int64),
+                np.ones(1, dtype=np.int64),
+                self._cx,
+                self._cy,
+                self._scale,
+                np.zeros((1, 2, 2), dtype=np.int32),
+            )
+        if stamp_sprites is not None:
+            stamp_sprites(
+                np.zeros((size, size, 3), dtype=np.uint8),
+                np.zeros(1, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+                self._sprite_stamp,
+                self._sprite_mask,
+            )
         self.running = True
 
     def shutdown(self) -> None:
@@ -68,53 +222,133 @@ class Visualizer:
 
     def _world_to_pixel(self, world_pos: Vector2) -> Tuple[int, int]:
         """Convert world meters to pixel coordinates (center at window center)."""
-        cx, cy = self.config.window_width / 2, self.config.window_height / 2
-        px = cx + world_pos.x * self.config.pixel_scale_m
-        py = cy - world_pos.y * self.config.pixel_scale_m  # y-flip for screen coords
+        px = self._cx + world_pos.x * self._scale
+        py = self._cy - world_pos.y * self._scale  # y-flip for screen coords
         return int(px), int(py)
 
-    def _pixel_in_bounds(self, px: int, py: int) -> bool:
-        """Check if pixel coordinates are visible."""
-        return 0 <= px < self.config.window_width and 0 <= py < self.config.window_height
+    def _world_to_pixel_batch(self, points: np.ndarray) -> np.ndarray:
+        """Convert a `(K, 2)` array of world positions to int32 pixel coords.
 
-    def _draw_trail(self, electron_id: int, points: List[Vector2]) -> None:
-        """Draw a line trail for an electron; cap old points if needed."""
-        if len(points) < 2 or not self.screen:
+        One broadcasted pass replaces K scalar `_world_to_pixel` calls; used
+        for whole trails each frame.
+        """
+        pixels = np.empty_like(points, dtype=np.float64)
+        pixels[:, 0] = self._cx + points[:, 0] * self._scale
+        pixels[:, 1] = self._cy - points[:, 1] * self._scale
+        return pixels.astype(np.int32)
+
+    def register_electrons(self, count: int) -> None:
+        """Size the trail registry for a dense set of electron indices.
+
+        All trails share one contiguous `(count, max_trail_points, 2)` array;
+        each `TrailBuffer` is a row view into it, so per-electron trail state
+        is an integer index into structure-of-arrays storage rather than a
+        hashed identity, and cross-electron batch operations see one block of
+        memory. Existing trail contents survive a growing registration.
+        """
+        if count <= len(self.trails):
             return
-        
-        # Cull oldest points if trail exceeds max length
-        if len(points) > self.config.max_trail_points:
-            del points[: len(points) - self.config.max_trail_points]
-
-        # Draw segments between consecutive points
-        for i in range(len(points) - 1):
-            px0, py0 = self._world_to_pixel(points[i])
-            px1, py1 = self._world_to_pixel(points[i + 1])
-            if self._pixel_in_bounds(px0, py0) or self._pixel_in_bounds(px1, py1):
-                pygame.draw.line(self.screen, COLOR_TRAIL, (px0, py0), (px1, py1), 1)
-
-    def _draw_electron(self, electron: Electron) -> None:
-        """Draw a single electron and its trail."""
-        if not self.screen:
+        registry = np.empty((count, self.config.max_trail_points, 2), dtype=np.float64)
+        trails: List[TrailBuffer] = []
+        for i in range(count):
+            if i < len(self.trails):
+                old = self.trails[i]
+                registry[i] = old.buffer
+                trails.append(TrailBuffer(registry[i], head=old.head, count=old.count))
+            else:
+                trails.append(TrailBuffer(registry[i]))
+        self.trails = trails
+        self._trail_registry = registry
+        self._trail_heads = np.zeros(count, dtype=np.int64)
+        self._trail_counts = np.zeros(count, dtype=np.int64)
+        self._pixel_scratch = np.empty((count, self.config.max_trail_points, 2), dtype=np.int32)
+
+    def _compute_trail_pixels(self) -> Optional[np.ndarray]:
+        """Convert every trail to pixel coordinates in one compiled pass.
+
+        Returns the `(N, max_trail_points, 2)` int32 scratch block with row
+        `i` holding `trails[i].count` unwrapped (oldest-to-newest) points, or
+        `None` when Numba is unavailable — callers then fall back to the
+        per-trail NumPy conversion.
+        """
+        if trails_to_pixels is None or self._trail_registry is None:
+            return None
+        for i, trail in enumerate(self.trails):
+            self._trail_heads[i] = trail.head
+            self._trail_counts[i] = trail.count
+        trails_to_pixels(
+            self._trail_registry,
+            self._trail_heads,
+            self._trail_counts,
+            self._cx,
+            self._cy,
+            self._scale,
+            self._pixel_scratch,
+        )
+        return self._pixel_scratch
+
+    def _draw_trail(
+        self,
+        surface: pygame.Surface,
+        trail: TrailBuffer,
+        pixels: Optional[np.ndarray] = None,
+    ) -> None:
+        """Draw a full trail polyline; the ring buffer caps its own length."""
+        if trail.count < 2:
             return
 
-        eid = id(electron)
-        if eid not in self.trails:
-            self.trails[eid] = []
-        self.trails[eid].append(electron.position)
-
-        # Draw trail
-        self._draw_trail(eid, self.trails[eid])
-
-        # Draw current position as a circle
-        px, py = self._world_to_pixel(electron.position)
-        if self._pixel_in_bounds(px, py):
-            pygame.draw.circle(self.screen, COLOR_ELECTRON, (px, py), self.config.electron_radius_px)
+        # The ring buffer is already a contiguous world-coordinate array:
+        # convert to pixels in one vectorized pass (or take the row already
+        # produced by the compiled kernel).
+        if pixels is None:
+            pixels = self._world_to_pixel_batch(trail.as_array())
+        else:
+            pixels = pixels[: trail.count]
+
+        # Cull against the window before rasterizing: a segment is worth
+        # drawing only if either endpoint is on screen. The mask is one
+        # vectorized pass, and fully off-screen stretches never reach SDL.
+        px = pixels[:, 0]
+        py = pixels[:, 1]
+        visible = (
+            (px >= 0)
+            & (px < self.config.window_width)
+            & (py >= 0)
+            & (py < self.config.window_height)
+        )
+        draw_lines = pygame.draw.aalines if self.config.antialias else pygame.draw.lines
+        if visible.all():
+            draw_lines(surface, COLOR_TRAIL, False, pixels)
+            return
 
-        # Draw current position as a circle
-        px, py = self._world_to_pixel(electron.position)
-        if self._pixel_in_bounds(px, py):
-            pygame.draw.circle(self.screen, COLOR_ELECTRON, (px, py), self.config.electron_radius_px)
+        # Split the polyline into visible runs: pad the segment mask with
+        # zeros so diff yields paired run start/stop segment indices, then
+        # draw each run as its own polyline.
+        seg_visible = np.empty(trail.count + 1, dtype=np.int8)
+        seg_visible[0] = 0
+        seg_visible[-1] = 0
+        np.logical_or(visible[:-1], visible[1:], out=seg_visible[1:-1])
+        edges = np.flatnonzero(np.diff(seg_visible))
+        for start, stop in zip(edges[0::2], edges[1::2]):
+            draw_lines(surface, COLOR_TRAIL, False, pixels[start : stop + 1])
+
+    def _redraw_trail_surface(self) -> None:
+        """Rebuild the persistent trail layer from the ring buffers.
+
+        Runs periodically once trails are evicting points: the incremental
+        background-colored erases of evicted segments can nick overlapping
+        trails, and a full redraw repairs the damage.
+        """
+        self._trail_surface.blit(self._background, (0, 0))
+        trail_pixels = self._compute_trail_pixels()
+        for index, trail in enumerate(self.trails):
+            self._draw_trail(
+                self._trail_surface,
+                trail,
+                None if trail_pixels is None else trail_pixels[index],
+            )
+        self._frames_since_trail_redraw = 0
+        self._trail_surface_stale = False
 
     def _handle_input(self) -> dict:
         """Process keyboard input and return adjustment dict.
@@ -174,11 +408,19 @@ class Visualizer:
             "+/- : Change B field",
             "SPACE: Pause | C: Clear | R: Reset | H: Hide | ESC: Quit",
         ]
-        
+
+        if self._help_surface is None:
+            # Static text: rasterize all lines once onto a single surface.
+            line_surfs = [self.small_font.render(line, True, COLOR_TEXT) for line in lines]
+            width = max(s.get_width() for s in line_surfs)
+            self._help_surface = pygame.Surface(
+                (width, len(lines) * 16), pygame.SRCALPHA
+            ).convert_alpha()
+            for i, line_surf in enumerate(line_surfs):
+                self._help_surface.blit(line_surf, (0, i * 16))
+
         y_offset = self.config.window_height - len(lines) * 16 - 10
-        for i, line in enumerate(lines):
-            text_surf = self.small_font.render(line, True, COLOR_TEXT)
-            self.screen.blit(text_surf, (10, y_offset + i * 16))
+        self.screen.blit(self._help_surface, (10, y_offset))
 
     def render(
         self,
@@ -206,31 +448,165 @@ class Visualizer:
         if input_dict['clear']:
             self.clear_trails()
 
-        # Clear and draw
-        self.screen.fill(COLOR_BG)
-        for electron in electrons:
-            self._draw_electron(electron)
+        # Anything that changes pixels outside the tracked sprite/trail/status
+        # regions forces one full presentation; steady-state frames present
+        # only their dirty rectangles.
+        full_update = (
+            self._needs_full_update
+            or input_dict['pause_toggle']
+            or input_dict['help_toggle']
+            or input_dict['clear']
+        )
+        self._needs_full_update = False
+        dirty_rects: List[pygame.Rect] = []
+        sprite_rects: List[pygame.Rect] = []
+
+        # Clear and draw; while paused, reuse the cached world layer so the
+        # scene is one blit rather than a full trail re-rasterization.
+        if self.paused and self._paused_cache is not None:
+            self.screen.blit(self._paused_cache, (0, 0))
+            sprite_rects = self._prev_sprite_rects
+        else:
+            self.register_electrons(len(electrons))
+            # Update the persistent trail layer incrementally: erase the
+            # segment a full ring is about to evict, append the new position,
+            # and draw only the newest segment. Both touched segments are
+            # changed regions for dirty-rect presentation. The transform
+            # constants and bound methods are hoisted to locals: this loop is
+            # the hottest remaining scalar path, and attribute lookups per
+            # electron per frame add up.
+            capacity = self.config.max_trail_points
+            cx = self._cx
+            cy = self._cy
+            scale = self._scale
+            trail_surface = self._trail_surface
+            # Both primitives share the (surface, color, start, end) call
+            # shape; width stays at the 1-px default.
+            draw_line = pygame.draw.aaline if self.config.antialias else pygame.draw.line
+            for index, electron in enumerate(electrons):
+                trail = self.trails[index]
+                if trail.count == capacity:
+                    oldest = trail.buffer[trail.head]
+                    second = trail.buffer[(trail.head + 1) % capacity]
+                    apx = int(cx + oldest[0] * scale)
+                    apy = int(cy - oldest[1] * scale)
+                    bpx = int(cx + second[0] * scale)
+                    bpy = int(cy - second[1] * scale)
+                    draw_line(trail_surface, COLOR_BG, (apx, apy), (bpx, bpy))
+                    dirty_rects.append(_segment_rect(apx, apy, bpx, bpy))
+                    self._trail_surface_stale = True
+                trail.append(electron.position.x, electron.position.y)
+                if trail.count >= 2:
+                    newest = trail.buffer[(trail.head - 1) % capacity]
+                    prev = trail.buffer[(trail.head - 2) % capacity]
+                    apx = int(cx + prev[0] * scale)
+                    apy = int(cy - prev[1] * scale)
+                    bpx = int(cx + newest[0] * scale)
+                    bpy = int(cy - newest[1] * scale)
+                    draw_line(trail_surface, COLOR_TRAIL, (apx, apy), (bpx, bpy))
+                    dirty_rects.append(_segment_rect(apx, apy, bpx, bpy))
+
+            # Periodic repair pass; it may touch pixels far from any tracked
+            # rect, so the frame presents in full.
+            self._frames_since_trail_redraw += 1
+            if (
+                self._trail_surface_stale
+                and self._frames_since_trail_redraw >= TRAIL_REDRAW_INTERVAL_FRAMES
+            ):
+                self._redraw_trail_surface()
+                full_update = True
+
+            # The trail layer already includes the background, so it is the
+            # frame's base; sprites go on top, centered on each position.
+            self.screen.blit(self._trail_surface, (0, 0))
+            radius = self.config.electron_radius_px
+            if stamp_sprites is not None and len(electrons) >= SPRITE_STAMP_MIN_ELECTRONS:
+                # Many electrons: stamp the glyph straight into a framebuffer
+                # pixel view in one parallel pass instead of N SDL blit
+                # calls. The view keeps the surface locked, so it is dropped
+                # before anything else touches the screen.
+                size = 2 * radius + 1
+                xs = np.empty(len(electrons), dtype=np.int64)
+                ys = np.empty(len(electrons), dtype=np.int64)
+                for i, electron in enumerate(electrons):
+                    pos = electron.position
+                    xs[i] = int(cx + pos.x * scale) - radius
+                    ys[i] = int(cy - pos.y * scale) - radius
+                pixels = pygame.surfarray.pixels3d(self.screen)
+                stamp_sprites(pixels, xs, ys, self._sprite_stamp, self._sprite_mask)
+                del pixels
+                sprite_rects = [pygame.Rect(x, y, size, size) for x, y in zip(xs, ys)]
+            else:
+                # Few electrons: SDL's batched blits() beats locking the
+                # framebuffer. Off-screen blits are clipped by SDL itself.
+                sprite = self._electron_sprite
+                blit_pairs = []
+                for electron in electrons:
+                    pos = electron.position
+                    blit_pairs.append(
+                        (
+                            sprite,
+                            (int(cx + pos.x * scale) - radius, int(cy - pos.y * scale) - radius),
+                        )
+                    )
+                sprite_rects = self.screen.blits(blit_pairs)
+            self._paused_cache = self.screen.copy() if self.paused else None
+
+        # Draw status text. The time line re-renders only when its formatted
+        # value changes; the remaining lines recur and go through the keyed
+        # status cache.
+        time_text = f"t = {time_s:.3e} s"
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self._last_time_surf = self.font.render(time_text, True, COLOR_TEXT)
+        status_rects = [self.screen.blit(self._last_time_surf, (10, 10))]
 
-        # Draw status text
         status_lines = [
-            f"t = {time_s:.3e} s",
             f"E = ({e_field_v_per_m.x:.2e}, {e_field_v_per_m.y:.2e}) V/m",
             f"B_z = {b_field_tesla_z:.2e} T",
         ]
         if self.paused:
             status_lines.append("[PAUSED]")
-        
-        for i, line in enumerate(status_lines):
-            text_surf = self.font.render(line, True, COLOR_TEXT)
-            self.screen.blit(text_surf, (10, 10 + i * 28))
+
+        for i, line in enumerate(status_lines, start=1):
+            text_surf = self._status_cache.get(line)
+            if text_surf is None:
+                if len(self._status_cache) > 128:
+                    self._status_cache.clear()
+                text_surf = self.font.render(line, True, COLOR_TEXT)
+                self._status_cache[line] = text_surf
+            status_rects.append(self.screen.blit(text_surf, (10, 10 + i * 28)))
 
         if self.show_help:
             self._draw_help()
 
-        pygame.display.flip()
-        self.clock.tick(self.config.fps)
+        if full_update:
+            pygame.display.flip()
+        else:
+            # Present only the regions that can differ from the last frame:
+            # sprites at both their old and new positions, trail segments that
+            # appeared or fell off a full ring, and the status text block
+            # (previous frame's extents too, in case a line got narrower).
+            dirty_rects.extend(self._prev_sprite_rects)
+            dirty_rects.extend(sprite_rects)
+            dirty_rects.extend(self._prev_status_rects)
+            dirty_rects.extend(status_rects)
+            pygame.display.update(dirty_rects)
+        self._prev_sprite_rects = sprite_rects
+        self._prev_status_rects = status_rects
+        if self.config.busy_loop:
+            self.clock.tick_busy_loop(self.config.fps)
+        else:
+            self.clock.tick(self.config.fps)
         return not input_dict['quit'], input_dict
 
     def clear_trails(self) -> None:
         """Reset all particle trails."""
-        self.trails.clear()
+        for trail in self.trails:
+            trail.clear()
+        if self._trail_surface is not None:
+            self._trail_surface.blit(self._background, (0, 0))
+        self._frames_since_trail_redraw = 0
+        self._trail_surface_stale = False
+        self._paused_cache = None
+        self._needs_full_update = True